@@ -0,0 +1,351 @@
+# ── imports ────────────────────────────────────────────────────────────
+import array, math, os
+from random import getrandbits
+import micropython, time
+from micropython import const
+import uasyncio as asyncio
+from machine import Pin, PWM, mem32
+
+# ── config ─────────────────────────────────────────────────────────────
+RGB_BUTTON_PINS = [
+    {"red": 2,  "green": 3,  "blue": 4,  "button": 5},
+    {"red": 6,  "green": 7,  "blue": 8,  "button": 9},
+    {"red": 10, "green": 11, "blue": 12, "button": 13},
+]
+
+GAMMA = 2.2          # ≈2.0-2.4 suits most LEDs; tweak to taste
+DEBOUNCE_MS = const(40)  # ignore button edges closer together than this
+
+# ── lookup tables ──────────────────────────────────────────────────────
+# One sine period, already scaled to 0‒65535, so the animation never calls
+# math.sin (soft-float on the RP2040).  Phases are plain ints with a full
+# turn = 65536; the top _SIN_LUT_BITS of a phase index the table.
+_SIN_LUT_BITS = const(8)
+_SIN_LUT_SIZE = const(1 << _SIN_LUT_BITS)
+_SIN_LUT_MASK = const(_SIN_LUT_SIZE - 1)
+_PHASE_SHIFT  = const(16 - _SIN_LUT_BITS)      # phase → LUT index
+_PHASE_THIRD  = const(65536 // 3)              # 120° phase shift
+SIN_U16 = array.array('H', [int((math.sin(2*math.pi*k/_SIN_LUT_SIZE) * .5 + .5) * 65535)
+                            for k in range(_SIN_LUT_SIZE)])
+del math                     # only needed to build the table
+
+# ── hardware init ──────────────────────────────────────────────────────
+rgb_pwms = []
+for spec in RGB_BUTTON_PINS:
+    rgb_pwms.append({
+        "red"  : PWM(Pin(spec["red" ],  Pin.OUT), freq=1_000, duty_u16=0),
+        "green": PWM(Pin(spec["green"], Pin.OUT), freq=1_000, duty_u16=0),
+        "blue" : PWM(Pin(spec["blue"],  Pin.OUT), freq=1_000, duty_u16=0),
+    })
+
+# ── direct PWM register access (RP2040 only) ──────────────────────────
+# On an RP2040, set_rgb() writes the compare registers itself instead of nine
+# duty_u16() calls per frame.  A GPIO drives PWM slice (gpio >> 1) & 7, channel
+# gpio & 1; each slice's CC register holds channel A in bits 0-15 and B in
+# bits 16-31.  pwm_cc shadows those halves (index gpio & 15) so a write can't
+# clobber the neighbouring channel.  Other chips (e.g. the RP2350, whose PWM
+# block lives elsewhere) fall back to the bound duty_u16() setters.
+FAST_PWM = "RP2040" in os.uname().machine
+
+_PWM_BASE   = const(0x40050000)
+_PWM_STRIDE = const(0x14)     # bytes per slice
+_PWM_CC     = const(0x0c)
+_PWM_TOP    = const(0x10)
+
+if FAST_PWM:
+    LED_GPIOS = bytes(spec[c] for spec in RGB_BUTTON_PINS for c in ("red", "green", "blue"))
+    pwm_cc    = array.array('H', [0] * 16)
+    for gpio in LED_GPIOS:
+        cc = mem32[_PWM_BASE + ((gpio >> 1) & 7) * _PWM_STRIDE + _PWM_CC]
+        pwm_cc[gpio & 14]       =  cc        & 0xFFFF
+        pwm_cc[(gpio & 14) + 1] = (cc >> 16) & 0xFFFF
+    # all LED slices run at the same freq, so they share one TOP
+    pwm_top   = mem32[_PWM_BASE + ((LED_GPIOS[0] >> 1) & 7) * _PWM_STRIDE + _PWM_TOP] & 0xFFFF
+    gamma_max = pwm_top + 1                    # full scale in PWM counts
+else:
+    # bound duty setters per LED, so set_rgb() skips the dict/attribute lookups
+    RGB_SETTERS = [(p["red"].duty_u16, p["green"].duty_u16, p["blue"].duty_u16)
+                   for p in rgb_pwms]
+    gamma_max = 65535                          # full scale in duty_u16 units
+
+# γ-curve indexed by the high byte of a linear 0‒65535 duty, in the units
+# set_rgb() writes (see above)
+GAMMA_LUT = array.array('H', [min(0xFFFF, int((i / 255) ** GAMMA * gamma_max + 0.5))
+                              for i in range(256)])
+
+buttons = [Pin(spec["button"], Pin.IN, Pin.PULL_UP) for spec in RGB_BUTTON_PINS]
+
+# ── piezo buzzer ───────────────────────────────────────────────
+# Active-high on GP15; keep it silent until we need it
+buzzer = PWM(Pin(15, Pin.OUT))
+buzzer.duty_u16(0)
+
+# ── globals used by the coroutines ─────────────────────────────────────
+# palette as parallel r/g/b arrays: 3 rainbow colours + black.  Length must
+# be a power of two (pad with black) so stepping through it is `& _PALETTE_MASK`.
+_PALETTE_LEN  = const(4)
+_PALETTE_MASK = const(_PALETTE_LEN - 1)
+PAL_R       = array.array('H', [0] * _PALETTE_LEN)
+PAL_G       = array.array('H', [0] * _PALETTE_LEN)
+PAL_B       = array.array('H', [0] * _PALETTE_LEN)
+frame_tables = {}                           # steps → rainbow() frame table
+states      = array.array('B', [0, 1, 2])   # current palette index of each button
+sync_event  = asyncio.ThreadSafeFlag()      # set when all three indices equal
+button_flag = asyncio.ThreadSafeFlag()      # set from the button IRQs
+pressed     = 0                             # bitmask of buttons with a new edge
+edge_ms     = [0, 0, 0]                     # ticks_ms() of each button's last edge
+SOUND_Q     = []                            # pending (freq, dur, duty) notes
+sound_len   = 0                             # length of the tune now playing
+sound_event = asyncio.ThreadSafeFlag()      # set when notes are queued
+
+# ── helpers ────────────────────────────────────────────────────────────
+@micropython.viper
+def set_rgb_regs(idx: int, r: int, g: int, b: int):
+    """Apply γ-correction then write PWM registers of one LED trio (RP2040)."""
+    lut    = ptr16(GAMMA_LUT)
+    cc     = ptr16(pwm_cc)
+    gpio   = ptr8(LED_GPIOS)
+    regs   = int(_PWM_BASE) + _PWM_CC         # big int: needs the cast
+    n = 3*idx
+    cc[gpio[n    ] & 15] = lut[r >> 8]
+    cc[gpio[n + 1] & 15] = lut[g >> 8]
+    cc[gpio[n + 2] & 15] = lut[b >> 8]
+    for k in range(n, n + 3):
+        sl = (gpio[k] >> 1) & 7
+        ptr32(regs + sl*_PWM_STRIDE)[0] = cc[2*sl] | (cc[2*sl + 1] << 16)
+
+@micropython.native
+def set_rgb_duty(idx, r, g, b):
+    """Apply γ-correction then write PWM to one LED trio via duty_u16()."""
+    s = RGB_SETTERS[idx]
+    s[0](GAMMA_LUT[r >> 8])
+    s[1](GAMMA_LUT[g >> 8])
+    s[2](GAMMA_LUT[b >> 8])
+
+set_rgb = set_rgb_regs if FAST_PWM else set_rgb_duty
+
+@micropython.viper
+def cycle_colours(out, phi: int, steps: int):
+    """Fill `out` with (r,g,b) × 3 LEDs for each of the `steps`+1 frames
+    of one rainbow cycle starting at phase `phi`."""
+    lut   = ptr16(SIN_U16)
+    buf   = ptr16(out)
+    n = 0
+    for i in range(steps + 1):
+        theta = phi + i*65536 // steps           # 0 → full turn
+        for idx in range(3):
+            p = theta + idx*_PHASE_THIRD
+            buf[n    ] = lut[( p                   >> _PHASE_SHIFT) & _SIN_LUT_MASK]
+            buf[n + 1] = lut[((p +   _PHASE_THIRD) >> _PHASE_SHIFT) & _SIN_LUT_MASK]
+            buf[n + 2] = lut[((p + 2*_PHASE_THIRD) >> _PHASE_SHIFT) & _SIN_LUT_MASK]
+            n += 3
+
+# ── sound helper ────────────────────────────────────────────────
+# tunes are (frequency Hz, duration ms, duty) notes, queued for sound_task()
+CLICK_TUNE = (                      # very short tick so the player feels the press
+    (400, 20, 1024),                # mid-pitch, 50 % duty, loud enough
+    )
+WIN_TUNE = (                        # 4-note arpeggio at 1/128 loudness
+    (440, 120, 512),    # A4
+    (523, 120, 512),    # C♯5
+    (659, 120, 512),    # E5
+    (784, 160, 512),    # G5
+    (1047, 320, 512),   # C6
+    (1319, 480, 512),   # E6  (held)
+    )
+_SOUND_Q_MAX = const(16)            # notes; tunes that don't fit are dropped
+
+def play(tune):
+    """Queue `tune` on the buzzer without spawning a task.
+
+    A tune is queued whole or not at all, and a shorter one (a click) is
+    dropped while a longer one plays rather than sounding late after it.
+    """
+    global sound_len
+    if len(tune) < sound_len or len(SOUND_Q) + len(tune) > _SOUND_Q_MAX:
+        return
+    SOUND_Q.extend(tune)
+    sound_len = len(tune)
+    sound_event.set()
+
+async def sound_task():
+    """Single long-running player that drains SOUND_Q note by note."""
+    global sound_len
+    while True:
+        await sound_event.wait()      # clears the flag on return
+        while SOUND_Q:
+            freq, dur, duty = SOUND_Q.pop(0)
+            buzzer.freq(freq)
+            buzzer.duty_u16(duty)
+            await asyncio.sleep_ms(dur)
+        buzzer.duty_u16(0)          # silence
+        sound_len = 0
+
+# ── async rainbow sweep (finite-length) ────────────────────────────────
+async def rainbow(duration_ms=3000, steps=60, loops=1):
+    """
+    Run `loops` complete rainbow cycles.
+
+    • duration_ms : time for ONE cycle (not total)
+    • steps       : frames per cycle (≥12 looks smooth on RP2040)
+    • loops       : how many cycles to do before returning
+
+    On exit PAL_R/PAL_G/PAL_B hold the colours from the LAST cycle.
+    """
+    start_phi = getrandbits(16)                # 16-bit phase
+
+    # -- make it as quick as the MCU allows, but never sleep <1 ms
+    delay = max(1, duration_ms // steps)
+
+    # whole cycle up front: 9 values (3 LEDs × r,g,b) per frame.  Kept per
+    # `steps` so repeat rainbows reuse it; array() takes the zeroed bytes
+    # as raw uint16s, so no temporary list of ints is built.
+    frames = frame_tables.get(steps)
+    if frames is None:
+        frames = frame_tables[steps] = array.array('H', bytes(2 * 9 * (steps + 1)))
+
+    for loop in range(loops):
+        cycle_colours(frames, start_phi, steps)
+        for i in range(steps + 1):                 # +1 gives perfect wrap
+            for idx in range(3):
+                n = 9*i + 3*idx
+                set_rgb(idx, frames[n], frames[n + 1], frames[n + 2])
+            await asyncio.sleep_ms(delay)
+
+        # rainbows are additive, so vary the start angle each loop
+        start_phi = (start_phi + getrandbits(16)) & 0xFFFF
+
+    # the table still holds the last cycle: its final frame is the palette
+    n = 9*steps
+    for idx in range(3):
+        PAL_R[idx], PAL_G[idx], PAL_B[idx] = frames[n], frames[n + 1], frames[n + 2]
+        n += 3
+
+# ---------------------------------------------------------------
+#  Startup: all LEDs off → FADE LED-0 → LED-1 → LED-2
+#           → three quick rainbow cycles → normal operation
+# ---------------------------------------------------------------
+async def startup_sequence(
+        pre_colour=(40000, 40000, 40000),  # target “white” for fade
+        fade_ms=400,                      # how long the fade for ONE LED lasts
+        steps=32,                         # more steps = smoother fade
+        gap_ms=120):                      # pause after each LED reaches full
+    """
+    Power-on flourish with per-LED fades (non-blocking).
+
+    • All LEDs off
+    • Each LED ramps from 0 → pre_colour in `fade_ms`
+    • Little gap, then next LED
+    • Finishes with rainbow() to build the palette
+    """
+
+    # 0) lights off
+    for idx in range(3):
+        set_rgb(idx, 0, 0, 0)
+    await asyncio.sleep_ms(gap_ms)
+
+    # 1) sequential fade-in, ramp computed once for all three LEDs
+    step_delay = max(1, fade_ms // steps)
+    r0, g0, b0 = pre_colour
+    fade_r = array.array('H', [r0 * n // steps for n in range(steps + 1)])
+    fade_g = array.array('H', [g0 * n // steps for n in range(steps + 1)])
+    fade_b = array.array('H', [b0 * n // steps for n in range(steps + 1)])
+    for idx in range(3):
+        for n in range(steps + 1):                # 0 … steps
+            set_rgb(idx, fade_r[n], fade_g[n], fade_b[n])
+            await asyncio.sleep_ms(step_delay)
+        await asyncio.sleep_ms(gap_ms)
+
+    # 2) run a rainbow once (adjust speed to taste)
+    await rainbow(duration_ms=400, steps=24, loops=3)
+
+# ── async flash sequence ───────────────────────────────────────────────
+async def flash(times=3, on_ms=120, off_ms=120):
+    s = states[0]                      # all three are the same colour
+    r, g, b = PAL_R[s], PAL_G[s], PAL_B[s]
+    for _ in range(times):
+        for idx in range(3):
+            set_rgb(idx, r, g, b)
+        await asyncio.sleep_ms(on_ms)
+        for idx in range(3):
+            set_rgb(idx, 0, 0, 0)
+        await asyncio.sleep_ms(off_ms)
+    # leave LEDs off until next rainbow starts
+
+# ── button watcher (one task for all buttons) ─────────────────────────
+def button_irq(idx):
+    """Build the pin IRQ handler for button `idx`: note the edge, wake the watcher."""
+    bit = 1 << idx
+    def handler(pin):
+        global pressed
+        pressed |= bit
+        edge_ms[idx] = time.ticks_ms()
+        button_flag.set()
+    return handler
+
+def handle_press(idx):
+    """Step button `idx` to its next colour and check for a match."""
+    s = states[idx] = (states[idx] + 1) & _PALETTE_MASK
+    set_rgb(idx, PAL_R[s], PAL_G[s], PAL_B[s])
+
+    play(CLICK_TUNE)
+
+    # did this press make them all the same?
+    if states[0] == states[1] == states[2]:
+        sync_event.set()
+
+async def watch_buttons():
+    global pressed
+    for idx in range(3):
+        buttons[idx].irq(trigger=Pin.IRQ_FALLING, handler=button_irq(idx))
+    values = tuple(pin.value for pin in buttons)   # bound once, not per press
+    last = [time.ticks_add(time.ticks_ms(), -DEBOUNCE_MS)] * 3
+    while True:
+        await button_flag.wait()                   # sleeps until a press
+
+        # async debounce: let the contacts settle, then take the edges
+        await asyncio.sleep_ms(DEBOUNCE_MS)
+        edges = pressed
+        pressed &= ~edges                          # keep any newer edges
+        for idx in range(3):
+            if not edges & (1 << idx):
+                continue
+            # bounce is an edge within DEBOUNCE_MS either side of the last
+            # press (a late IRQ can be stamped just before it); a stale
+            # `last` wraps to around -2^29, well outside this window
+            if -DEBOUNCE_MS < time.ticks_diff(edge_ms[idx], last[idx]) < DEBOUNCE_MS:
+                continue                           # bounce of the last press
+            if values[idx]():
+                continue                           # glitch or release bounce
+            last[idx] = time.ticks_ms()
+            handle_press(idx)
+
+# ── orchestrator: reacts to “all-three-match” ─────────────────────────
+async def sync_manager():
+    global states
+    while True:
+        await sync_event.wait()       # waits until set by watcher (auto-clears)
+
+        play(WIN_TUNE)
+        await flash()                 # flash a few times
+        # flash ➔ run 3 ultra-fast rainbows (0.4 s each)
+        await rainbow(duration_ms=400, steps=24, loops=3)
+
+        # 3) re-seed button indices so LEDs differ again
+        for idx in range(3):
+            states[idx] = idx
+            set_rgb(idx, PAL_R[idx], PAL_G[idx], PAL_B[idx])
+
+# ── main entry point ───────────────────────────────────────────────────
+async def main():
+    asyncio.create_task(sound_task())
+    await startup_sequence()                  # initial palette
+    asyncio.create_task(watch_buttons())
+    asyncio.create_task(sync_manager())
+
+    # keep the loop alive
+    while True:
+        await asyncio.sleep(3600)
+
+# ── run it ─────────────────────────────────────────────────────────────
+asyncio.run(main())
@@ -0,0 +1,6 @@
+# Freeze the game into a custom MicroPython build, e.g.
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/manifest.py
+# Frozen modules run straight from flash: no parsing, no RAM copy of the code.
+# Remove button_box.py/.mpy from the device filesystem, or it shadows this.
+include("$(PORT_DIR)/boards/manifest.py")
+module("button_box.py", opt=3)